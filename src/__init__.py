@@ -4,9 +4,15 @@ from core.logger import get_logger
 from core.settings import settings
 from services.file_store import file_store
 from database.store_factory import get_store_connection
-from database.redis_langgraph_client import redis_connection
-from database.postgresql_langgraph_client import postgresql_connection
-from database.mongodb_langgraph_client import mongodb_connection
+
+
+def __getattr__(name: str):
+    # Backend connections are loaded on first access, see database/__init__.py
+    if name in ("redis_connection", "postgresql_connection", "mongodb_connection"):
+        import database
+        return getattr(database, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "get_logger",
@@ -1,7 +1,7 @@
 """Core module for application configuration and logging."""
 
 from core.logger import get_logger, configure_root_logger, ColoredFormatter
-from core.settings import Settings, RedisSettings, settings
+from core.settings import Settings, RedisSettings, settings, get_settings
 
 __all__ = [
     "get_logger",
@@ -10,5 +10,6 @@ __all__ = [
     "Settings",
     "RedisSettings",
     "settings",
+    "get_settings",
 ]
 
@@ -1,15 +1,26 @@
 """File configuration management for MCP server."""
 
-import json
+import logging
 import os
+import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
 from core.logger import get_logger
 
 logger = get_logger("file_config")
 
+# Allowed characters for memory categories and file names
+_IDENT_RE = re.compile(r'\A[A-Za-z0-9_\-]+\Z')
+
+# Config directories with at least this many JSON files are loaded in parallel
+_PARALLEL_LOAD_MIN_FILES = 4
+_MAX_LOAD_WORKERS = 8
+
 
 class FileConfig(BaseModel):
     """Configuration for a single file within a memory category."""
@@ -20,13 +31,15 @@ class FileConfig(BaseModel):
     write_trigger: str = Field(..., description="When the agent should write/create this memory")
     update_trigger: str = Field(..., description="When the agent should update this memory")
     
+    model_config = ConfigDict(frozen=True, revalidate_instances='never')
+    
     @field_validator('file_name')
     @classmethod
     def validate_file_name(cls, v: str) -> str:
         """Validate file_name format."""
         if not v:
             raise ValueError("file_name cannot be empty")
-        if not v.replace('-', '').replace('_', '').isalnum():
+        if not _IDENT_RE.match(v):
             raise ValueError(
                 f"file_name must contain only alphanumeric characters, hyphens, and underscores. Got: {v}"
             )
@@ -43,29 +56,31 @@ class MemoryConfig(BaseModel):
     write_trigger: str = Field(..., description="When the agent should write/create this memory")
     update_trigger: str = Field(..., description="When the agent should update this memory")
     
+    model_config = ConfigDict(frozen=True, revalidate_instances='never')
+    
     @field_validator('memory_category', 'file_name')
     @classmethod
     def validate_identifier(cls, v: str) -> str:
         """Validate memory_category and file_name format."""
         if not v:
             raise ValueError("Identifier cannot be empty")
-        if not v.replace('-', '').replace('_', '').isalnum():
+        if not _IDENT_RE.match(v):
             raise ValueError(
                 f"Identifier must contain only alphanumeric characters, hyphens, and underscores. Got: {v}"
             )
         return v
     
-    @property
+    @cached_property
     def namespace(self) -> str:
         """Get LangGraph namespace (maps from memory_category)."""
         return self.memory_category
     
-    @property
+    @cached_property
     def key(self) -> str:
         """Get LangGraph key (maps from file_name)."""
         return self.file_name
     
-    @property
+    @cached_property
     def full_path(self) -> str:
         """Get the full path in format memory_category/file_name."""
         return f"{self.memory_category}/{self.file_name}"
@@ -75,6 +90,8 @@ class FileConfigCollection(BaseModel):
     """Collection of file configurations within a category."""
     
     files: list[FileConfig] = Field(default_factory=list)
+    
+    model_config = ConfigDict(frozen=True, revalidate_instances='never')
 
 
 class FileConfigManager:
@@ -89,10 +106,17 @@ class FileConfigManager:
         """
         self.config_dir = config_dir or "files"
         self.allowed_files = allowed_files or []
+        self._allowed_files_set = frozenset(allowed_files) if allowed_files else None
         self.files: list[MemoryConfig] = []
         self._files_by_path: dict[str, MemoryConfig] = {}
         self._files_by_namespace: dict[str, list[MemoryConfig]] = {}
         
+        # Tool description fragments, rebuilt whenever configurations are loaded
+        self._files_description = ""
+        self._read_triggers = ""
+        self._write_triggers = ""
+        self._update_triggers = ""
+        
         self.load_configs_from_directory()
     
     def load_configs_from_directory(self) -> None:
@@ -109,55 +133,34 @@ class FileConfigManager:
             logger.info("Server will run without predefined file configurations")
             return
         
-        all_memories: list[MemoryConfig] = []
-        
-        # Find all .json files in the directory
-        json_files = list(config_dir_path.glob("*.json"))
-        
-        # Filter out .example files
-        json_files = [f for f in json_files if not f.stem.endswith('.example')]
+        # Find all .json files in the directory, skipping .example files
+        with os.scandir(config_dir_path) as entries:
+            json_files = [
+                Path(entry.path) for entry in entries
+                if entry.name.endswith('.json')
+                and not entry.name.endswith('.example.json')
+                and entry.is_file()
+            ]
         
         if not json_files:
             logger.info(f"No JSON configuration files found in {self.config_dir}")
             return
         
-        for json_file in json_files:
-            # The filename (without .json) becomes the memory_category
-            memory_category = json_file.stem
-            
-            try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                # Parse the file collection
-                file_collection = FileConfigCollection(**data)
-                
-                # Create MemoryConfig objects with the category from filename
-                for file_config in file_collection.files:
-                    memory_config = MemoryConfig(
-                        memory_category=memory_category,
-                        file_name=file_config.file_name,
-                        file_description=file_config.file_description,
-                        read_trigger=file_config.read_trigger,
-                        write_trigger=file_config.write_trigger,
-                        update_trigger=file_config.update_trigger
-                    )
-                    all_memories.append(memory_config)
-                
-                logger.debug(f"Loaded {len(file_collection.files)} file(s) from {json_file.name}")
-            
-            except json.JSONDecodeError as e:
-                logger.error(f"Invalid JSON in {json_file.name}: {e}")
-                continue
-            except Exception as e:
-                logger.error(f"Error loading {json_file.name}: {e}")
-                continue
+        # Overlap file reads with a small thread pool when there are enough files
+        if len(json_files) >= _PARALLEL_LOAD_MIN_FILES:
+            max_workers = min(_MAX_LOAD_WORKERS, len(json_files))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                loaded = list(executor.map(self._load_config_file, json_files))
+        else:
+            loaded = [self._load_config_file(json_file) for json_file in json_files]
+        
+        all_memories = [mem for memories in loaded for mem in memories]
         
         # Filter files based on allowed files
-        if self.allowed_files:
+        if self._allowed_files_set is not None:
             self.files = [
                 mem for mem in all_memories 
-                if mem.file_name in self.allowed_files
+                if mem.file_name in self._allowed_files_set
             ]
             filtered_count = len(all_memories) - len(self.files)
             if filtered_count > 0:
@@ -170,17 +173,89 @@ class FileConfigManager:
             mem.full_path: mem for mem in self.files
         }
         
-        self._files_by_namespace = {}
+        files_by_namespace: defaultdict[str, list[MemoryConfig]] = defaultdict(list)
         for mem in self.files:
-            if mem.memory_category not in self._files_by_namespace:
-                self._files_by_namespace[mem.memory_category] = []
-            self._files_by_namespace[mem.memory_category].append(mem)
+            files_by_namespace[mem.memory_category].append(mem)
+        self._files_by_namespace = dict(files_by_namespace)
+        
+        self._build_tool_descriptions()
         
         logger.info(f"Loaded {len(self.files)} file configurations from {self.config_dir}")
         
         # Log configured files
+        if logger.isEnabledFor(logging.DEBUG):
+            for mem in self.files:
+                logger.debug("  - %s/%s: %s", mem.memory_category, mem.file_name, mem.file_description)
+    
+    def _load_config_file(self, json_file: Path) -> list[MemoryConfig]:
+        """Load the file configurations defined in a single JSON file.
+        
+        Args:
+            json_file: Path to the JSON file. Its name (without .json) is the memory_category.
+            
+        Returns:
+            List of MemoryConfig objects, empty if the file could not be loaded
+        """
+        # The filename (without .json) becomes the memory_category
+        memory_category = json_file.stem
+        
+        try:
+            # Parse and validate the file collection in a single pass
+            file_collection = FileConfigCollection.model_validate_json(json_file.read_bytes())
+            
+            # The category is shared by all entries, so validate it once
+            MemoryConfig.validate_identifier(memory_category)
+        
+        except ValidationError as e:
+            logger.error(f"Invalid configuration in {json_file.name}: {e}")
+            return []
+        except Exception as e:
+            logger.error(f"Error loading {json_file.name}: {e}")
+            return []
+        
+        # Entries are already validated, build MemoryConfig objects without revalidating
+        memories = [
+            MemoryConfig.model_construct(
+                memory_category=memory_category,
+                file_name=file_config.file_name,
+                file_description=file_config.file_description,
+                read_trigger=file_config.read_trigger,
+                write_trigger=file_config.write_trigger,
+                update_trigger=file_config.update_trigger
+            )
+            for file_config in file_collection.files
+        ]
+        
+        logger.debug("Loaded %d file(s) from %s", len(memories), json_file.name)
+        return memories
+    
+    def _build_tool_descriptions(self) -> None:
+        """Precompute the tool description fragments for the loaded configurations."""
+        if not self.has_configurations():
+            self._files_description = ""
+            self._read_triggers = ""
+            self._write_triggers = ""
+            self._update_triggers = ""
+            return
+        
+        files_lines = ["\n\nConfigured Files:"]
+        for category in sorted(self._files_by_namespace.keys()):
+            files_lines.append(f"\n{category}:")
+            for mem in self._files_by_namespace[category]:
+                files_lines.append(f"  - {mem.file_name}: {mem.file_description}")
+        
+        read_lines = ["\n\nWhen to read:"]
+        write_lines = ["\n\nWhen to create:"]
+        update_lines = ["\n\nWhen to update:"]
         for mem in self.files:
-            logger.debug(f"  - {mem.memory_category}/{mem.file_name}: {mem.file_description}")
+            read_lines.append(f"  - {mem.full_path}: {mem.read_trigger}")
+            write_lines.append(f"  - {mem.full_path}: {mem.write_trigger}")
+            update_lines.append(f"  - {mem.full_path}: {mem.update_trigger}")
+        
+        self._files_description = "\n".join(files_lines)
+        self._read_triggers = "\n".join(read_lines)
+        self._write_triggers = "\n".join(write_lines)
+        self._update_triggers = "\n".join(update_lines)
     
     def get_file_config(self, memory_category: str, file_name: str) -> Optional[MemoryConfig]:
         """Get file configuration by memory_category and file_name.
@@ -228,18 +303,7 @@ class FileConfigManager:
         Returns:
             Formatted string describing configured memories
         """
-        if not self.has_configurations():
-            return ""
-        
-        lines = ["\n\nConfigured Files:"]
-        
-        for category in sorted(self._files_by_namespace.keys()):
-            files = self._files_by_namespace[category]
-            lines.append(f"\n{category}:")
-            for mem in files:
-                lines.append(f"  - {mem.file_name}: {mem.file_description}")
-        
-        return "\n".join(lines)
+        return self._files_description
     
     def format_read_triggers(self) -> str:
         """Format read triggers for read_file tool description.
@@ -247,15 +311,7 @@ class FileConfigManager:
         Returns:
             Formatted string with read triggers
         """
-        if not self.has_configurations():
-            return ""
-        
-        lines = ["\n\nWhen to read:"]
-        
-        for mem in self.files:
-            lines.append(f"  - {mem.memory_category}/{mem.file_name}: {mem.read_trigger}")
-        
-        return "\n".join(lines)
+        return self._read_triggers
     
     def format_write_triggers(self) -> str:
         """Format write triggers for write_file tool description.
@@ -263,15 +319,7 @@ class FileConfigManager:
         Returns:
             Formatted string with write triggers
         """
-        if not self.has_configurations():
-            return ""
-        
-        lines = ["\n\nWhen to create:"]
-        
-        for mem in self.files:
-            lines.append(f"  - {mem.memory_category}/{mem.file_name}: {mem.write_trigger}")
-        
-        return "\n".join(lines)
+        return self._write_triggers
     
     def format_update_triggers(self) -> str:
         """Format update triggers for edit_file tool description.
@@ -279,13 +327,5 @@ class FileConfigManager:
         Returns:
             Formatted string with update triggers
         """
-        if not self.has_configurations():
-            return ""
-        
-        lines = ["\n\nWhen to update:"]
-        
-        for mem in self.files:
-            lines.append(f"  - {mem.memory_category}/{mem.file_name}: {mem.update_trigger}")
-        
-        return "\n".join(lines)
+        return self._update_triggers
 
@@ -1,5 +1,7 @@
 import logging
+import os
 import sys
+from functools import lru_cache
 from typing import Optional
 
 
@@ -16,11 +18,21 @@ class ColoredFormatter(logging.Formatter):
         'RESET': '\033[0m'         
     }
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Precompute the colored levelname for each level
+        self._colored_levels = {
+            level: f"{code}{level}{self.COLORS['RESET']}"
+            for level, code in self.COLORS.items()
+            if level != 'RESET'
+        }
+    
     def format(self, record):
         # Add color to levelname
         levelname = record.levelname
-        if levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[levelname]}{levelname}{self.COLORS['RESET']}"
+        colored = self._colored_levels.get(levelname)
+        if colored:
+            record.levelname = colored
         
         # Format the message
         result = super().format(record)
@@ -31,6 +43,39 @@ class ColoredFormatter(logging.Formatter):
         return result
 
 
+# Level name -> numeric level, resolved once instead of getattr(logging, ...) per call
+_LEVELS = logging.getLevelNamesMapping()
+
+# Formatters are stateless, so all handlers share the same instances
+_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+_COLORED_FORMATTER = ColoredFormatter(fmt=_LOG_FORMAT, datefmt=_DATE_FORMAT)
+_PLAIN_FORMATTER = logging.Formatter(fmt=_LOG_FORMAT, datefmt=_DATE_FORMAT)
+
+
+@lru_cache(maxsize=None)
+def _get_console_handler(log_level: int, use_colors: bool) -> logging.Handler:
+    """Get the stdout handler shared by all loggers with the same level and colors."""
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setLevel(log_level)
+    console_handler.setFormatter(_COLORED_FORMATTER if use_colors else _PLAIN_FORMATTER)
+    return console_handler
+
+
+def _configure_logger(logger: logging.Logger, level: Optional[str], use_colors: bool) -> None:
+    """Attach the shared console handler to a logger that has not been configured yet."""
+    # Determine log level
+    if level is None:
+        level = os.getenv('LOG_LEVEL', 'INFO').upper()
+    
+    log_level = _LEVELS.get(level, logging.INFO)
+    logger.setLevel(log_level)
+    logger.addHandler(_get_console_handler(log_level, use_colors))
+    
+    # Prevent propagation to root logger
+    logger.propagate = False
+
+
 def get_logger(
     name: str,
     level: Optional[str] = None,
@@ -48,43 +93,10 @@ def get_logger(
     Returns:
         Configured logger instance
     """
-    import os
-    
-    # Get the logger
+    # logging.getLogger caches loggers by name, so configuration only runs once per name
     logger = logging.getLogger(name)
-    
-    # Only configure if no handlers exist (avoid duplicate handlers)
     if not logger.handlers:
-        # Determine log level
-        if level is None:
-            level = os.getenv('LOG_LEVEL', 'INFO').upper()
-        
-        log_level = getattr(logging, level, logging.INFO)
-        logger.setLevel(log_level)
-        
-        # Create console handler
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(log_level)
-        
-        # Create formatter
-        if use_colors:
-            formatter = ColoredFormatter(
-                fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                datefmt='%Y-%m-%d %H:%M:%S'
-            )
-        else:
-            formatter = logging.Formatter(
-                fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                datefmt='%Y-%m-%d %H:%M:%S'
-            )
-        
-        console_handler.setFormatter(formatter)
-        
-        # Add handler to logger
-        logger.addHandler(console_handler)
-        
-        # Prevent propagation to root logger
-        logger.propagate = False
+        _configure_logger(logger, level, use_colors)
     
     return logger
 
@@ -102,24 +114,15 @@ def configure_root_logger(level: str = 'INFO', use_colors: bool = True):
     # Clear existing handlers
     root_logger.handlers.clear()
     
-    log_level = getattr(logging, level.upper(), logging.INFO)
+    log_level = _LEVELS.get(level.upper(), logging.INFO)
     root_logger.setLevel(log_level)
     
     # Create console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(log_level)
     
-    # Create formatter
-    if use_colors:
-        formatter = ColoredFormatter(
-            fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-    else:
-        formatter = logging.Formatter(
-            fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
+    # Select shared formatter
+    formatter = _COLORED_FORMATTER if use_colors else _PLAIN_FORMATTER
     
     console_handler.setFormatter(formatter)
     root_logger.addHandler(console_handler)
@@ -1,4 +1,5 @@
 import os
+from functools import cached_property, lru_cache
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from core.file_config import FileConfigManager
@@ -18,6 +19,11 @@ class RedisSettings(BaseSettings):
         env_file_encoding="utf-8",
         extra="ignore"
     )
+    
+    @cached_property
+    def url(self) -> str:
+        """Redis connection URL."""
+        return f"redis://:{self.PASSWORD}@{self.HOST}:{self.PORT}/{self.DB}"
 
 class PostgreSQLSettings(BaseSettings):
     """PostgreSQL connection settings."""
@@ -37,8 +43,9 @@ class PostgreSQLSettings(BaseSettings):
         extra="ignore"
     )
     
-    def get_connection_string(self) -> str:
-        """Build PostgreSQL connection string."""
+    @cached_property
+    def url(self) -> str:
+        """PostgreSQL connection string."""
         password_part = f":{self.PASSWORD}" if self.PASSWORD else ""
         return f"postgresql://{self.USER}{password_part}@{self.HOST}:{self.PORT}/{self.DATABASE}?sslmode={self.SSLMODE}"
 
@@ -84,15 +91,6 @@ class Settings(BaseSettings):
         description="Memory store backend: 'redis', 'postgresql', or 'mongodb'"
     )
     
-    # Redis configuration
-    redis: RedisSettings = Field(default_factory=RedisSettings)
-    
-    # PostgreSQL configuration
-    postgresql: PostgreSQLSettings = Field(default_factory=PostgreSQLSettings)
-    
-    # MongoDB configuration
-    mongodb: MongoDBSettings = Field(default_factory=MongoDBSettings)
-    
     # Memory Store Configuration
     CONFIG_DIR: str = Field(
         default="files",
@@ -102,26 +100,33 @@ class Settings(BaseSettings):
         default="",
         description="Comma-separated list of allowed file names. Empty means all files are allowed."
     )
+    ALLOWED_NAMESPACES: str = Field(
+        default="",
+        description="Comma-separated list of allowed memory categories. Empty means all categories are allowed."
+    )
     READ_ONLY_FILES: str = Field(
         default="",
         description="Comma-separated list of read-only files in format 'memory_category/file_name'"
     )
-    file_config: FileConfigManager | None = Field(
-        default=None,
-        description="File configuration manager instance"
+    FILE_STORE_DEDUP_WRITES: bool = Field(
+        default=False,
+        description="Skip write_file when the stored content is identical (checked for content under 4KB)"
     )
     
-    def get_allowed_files(self) -> list[str]:
-        """Get list of allowed file names from comma-separated string."""
-        if not self.ALLOWED_FILES or not self.ALLOWED_FILES.strip():
-            return []
-        return [item.strip() for item in self.ALLOWED_FILES.split(',') if item.strip()]
+    @cached_property
+    def allowed_files(self) -> frozenset[str]:
+        """Allowed file names parsed from the comma-separated ALLOWED_FILES."""
+        return frozenset(item.strip() for item in self.ALLOWED_FILES.split(',') if item.strip())
+    
+    @cached_property
+    def allowed_namespaces(self) -> frozenset[str]:
+        """Allowed memory categories parsed from the comma-separated ALLOWED_NAMESPACES."""
+        return frozenset(item.strip() for item in self.ALLOWED_NAMESPACES.split(',') if item.strip())
     
-    def get_read_only_files(self) -> list[str]:
-        """Get list of read-only files from comma-separated string."""
-        if not self.READ_ONLY_FILES or not self.READ_ONLY_FILES.strip():
-            return []
-        return [item.strip() for item in self.READ_ONLY_FILES.split(',') if item.strip()]
+    @cached_property
+    def read_only_files(self) -> frozenset[str]:
+        """Read-only files parsed from the comma-separated READ_ONLY_FILES."""
+        return frozenset(item.strip() for item in self.READ_ONLY_FILES.split(',') if item.strip())
     
     model_config = SettingsConfigDict(
         case_sensitive=True,
@@ -130,21 +135,39 @@ class Settings(BaseSettings):
         extra="ignore"
     )
     
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        # Initialize nested settings
-        self.redis = RedisSettings()
-        self.postgresql = PostgreSQLSettings()
-        self.mongodb = MongoDBSettings()
-        # Initialize file config manager
-        allowed_files = self.get_allowed_files()
-        self.model_fields_set.add('file_config')  # Mark file_config as set
-        self.file_config = FileConfigManager(
+    # Backend settings are only built (and read from .env) when first used,
+    # so the backends that are not selected never load their settings
+    @cached_property
+    def redis(self) -> RedisSettings:
+        """Redis configuration."""
+        return RedisSettings()
+    
+    @cached_property
+    def postgresql(self) -> PostgreSQLSettings:
+        """PostgreSQL configuration."""
+        return PostgreSQLSettings()
+    
+    @cached_property
+    def mongodb(self) -> MongoDBSettings:
+        """MongoDB configuration."""
+        return MongoDBSettings()
+    
+    @cached_property
+    def file_config(self) -> FileConfigManager:
+        """File configuration manager, loaded from CONFIG_DIR on first access."""
+        allowed_files = self.allowed_files
+        return FileConfigManager(
             config_dir=self.CONFIG_DIR,
-            allowed_files=allowed_files if allowed_files else None
+            allowed_files=list(allowed_files) if allowed_files else None
         )
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the application settings, parsed once per process."""
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
 
@@ -1,10 +1,28 @@
 """Database module for multi-backend store operations."""
 
-from database.redis_langgraph_client import RedisConnection, redis_connection
-from database.postgresql_langgraph_client import PostgreSQLConnection, postgresql_connection
-from database.mongodb_langgraph_client import MongoDBConnection, mongodb_connection
+import importlib
+
 from database.store_factory import get_store_connection
 
+# Backend clients are imported on first access, so importing the package
+# doesn't build every connection (and load every backend's settings)
+_LAZY_EXPORTS = {
+    "RedisConnection": "database.redis_langgraph_client",
+    "redis_connection": "database.redis_langgraph_client",
+    "PostgreSQLConnection": "database.postgresql_langgraph_client",
+    "postgresql_connection": "database.postgresql_langgraph_client",
+    "MongoDBConnection": "database.mongodb_langgraph_client",
+    "mongodb_connection": "database.mongodb_langgraph_client",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
+
+
 __all__ = [
     "RedisConnection",
     "redis_connection",
@@ -0,0 +1,8 @@
+"""Helpers shared by the backend connection clients."""
+
+from typing import Optional
+
+
+def ttl_key(ttl_config: Optional[dict]) -> Optional[tuple]:
+    """Hashable cache key for a TTL configuration."""
+    return tuple(sorted(ttl_config.items())) if ttl_config else None
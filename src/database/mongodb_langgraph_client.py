@@ -1,41 +1,73 @@
+import asyncio
 import os
+import re
 
 from core.settings import settings
 from core.logger import get_logger
+from database._common import ttl_key
 from langgraph.store.mongodb import MongoDBStore
 from pymongo import MongoClient
 from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Optional
 
 logger = get_logger("mongodb_connection")
 
+
+@lru_cache(maxsize=256)
+def _key_regex(pattern: str) -> re.Pattern:
+    """Compile a case-insensitive regex matching keys that contain pattern literally."""
+    return re.compile(re.escape(pattern), re.IGNORECASE)
+
+
 class MongoDBConnection:
+    __slots__ = (
+        "settings", "mongodb_uri", "database_name", "collection_name",
+        "ttl_config", "_setup_done", "_lock", "_client", "_stores",
+    )
+    
     def __init__(self):
         self.settings = settings.mongodb
         self.mongodb_uri = self.settings.URI
         self.database_name = self.settings.DATABASE
         self.collection_name = self.settings.COLLECTION
-        os.environ["MONGODB_URI"] = self.mongodb_uri
-        logger.debug(f"Initializing MongoDB connection to {self.mongodb_uri}")
+        os.environ.setdefault("MONGODB_URI", self.mongodb_uri)
+        logger.debug("Initializing MongoDB connection to %s", self.mongodb_uri)
         
         # Default TTL configuration
         self.ttl_config = None
         self._setup_done = False
+        self._lock = asyncio.Lock()
         self._client = None
         
+        # Stores are reused per TTL configuration, building one creates the indexes
+        self._stores: dict[Optional[tuple], MongoDBStore] = {}
+        
+    def _get_collection(self):
+        """Return the store collection, creating the MongoDB client on first use."""
+        if self._client is None:
+            self._client = MongoClient(self.mongodb_uri)
+        return self._client[self.database_name][self.collection_name]
+    
+    async def _create_store(self, ttl_config: Optional[dict]) -> MongoDBStore:
+        """Build a store for a TTL configuration and cache it."""
+        # The constructor lists and creates indexes with the synchronous client
+        store = await asyncio.to_thread(
+            MongoDBStore, collection=self._get_collection(), ttl_config=ttl_config
+        )
+        self._stores[ttl_key(ttl_config)] = store
+        return store
+    
     async def ensure_setup(self):
         """Ensure the store is set up (run any necessary initialization)."""
-        if not self._setup_done:
-            logger.info("Running MongoDB store setup...")
-            # MongoDB store may have a setup method, call it if available
-            if self._client is None:
-                self._client = MongoClient(self.mongodb_uri)
-            db = self._client[self.database_name]
-            collection = db[self.collection_name]
-            store = MongoDBStore(collection=collection)
-            if hasattr(store, 'setup'):
-                await store.setup()
-            self._setup_done = True
-            logger.info("MongoDB store setup completed")
+        if self._setup_done:
+            return
+        async with self._lock:
+            if not self._setup_done:
+                logger.info("Running MongoDB store setup...")
+                await self._create_store(self.ttl_config)
+                self._setup_done = True
+                logger.info("MongoDB store setup completed")
     
     @asynccontextmanager
     async def get_store(self, ttl_config: dict = None):
@@ -47,20 +79,56 @@ class MongoDBConnection:
         
         ttl = ttl_config or self.ttl_config
         
-        logger.debug(f"Returning MongoDB store for database: {self.database_name}, collection: {self.collection_name}")
+        logger.debug("Returning MongoDB store for database: %s, collection: %s", self.database_name, self.collection_name)
         
-        # Create MongoDB client if not exists
-        if self._client is None:
-            self._client = MongoClient(self.mongodb_uri)
-        db = self._client[self.database_name]
-        collection = db[self.collection_name]
+        store = self._stores.get(ttl_key(ttl))
+        if store is None:
+            async with self._lock:
+                store = self._stores.get(ttl_key(ttl)) or await self._create_store(ttl)
+        
+        # The store is shared, nothing to clean up per call
+        yield store
+    
+    async def close(self):
+        """
+        Close the MongoDB client and drop the cached stores. Meant for process shutdown,
+        the client is shared by all sessions. A new client is created on next use.
+        """
+        self._stores.clear()
+        self._setup_done = False
+        if self._client is not None:
+            client, self._client = self._client, None
+            await asyncio.to_thread(client.close)
+    
+    async def count_namespaces(self, user_id: str) -> dict[str, int]:
+        """
+        Count stored items per namespace for a user.
+        Aggregated server-side with $group instead of fetching every item.
+        """
+        await self.ensure_setup()
+        collection = self._get_collection()
+        pipeline = [
+            {"$match": {"namespace.0": user_id, "namespace": {"$size": 2}}},
+            {"$group": {"_id": {"$arrayElemAt": ["$namespace", 1]}, "file_count": {"$sum": 1}}},
+        ]
         
-        store = MongoDBStore(collection=collection, ttl=ttl)
-        try:
-            yield store
-        finally:
-            # MongoDB store doesn't need explicit cleanup in context manager
-            pass
+        # pymongo is synchronous, keep the aggregation off the event loop
+        docs = await asyncio.to_thread(lambda: list(collection.aggregate(pipeline)))
+        return {doc["_id"]: doc["file_count"] for doc in docs}
+    
+    async def search_keys(self, user_id: str, namespace: str, pattern: str) -> list[dict]:
+        """
+        Find keys in a namespace that contain pattern (case-insensitive).
+        Filtered server-side with $regex, only key and timestamps are returned.
+        """
+        await self.ensure_setup()
+        collection = self._get_collection()
+        query = {"namespace": [user_id, namespace], "key": _key_regex(pattern.lower())}
+        projection = {"_id": 0, "key": 1, "created_at": 1, "updated_at": 1}
+        
+        # pymongo is synchronous, keep the query off the event loop
+        return await asyncio.to_thread(lambda: list(collection.find(query, projection)))
+
 
 
 mongodb_connection = MongoDBConnection()
@@ -3,30 +3,84 @@ import asyncio
 
 from core.settings import settings
 from core.logger import get_logger
+from database._common import ttl_key
 from langgraph.store.postgres import AsyncPostgresStore
+from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool
 from contextlib import asynccontextmanager
+from typing import Optional
 
 logger = get_logger("postgresql_connection")
 
+# Connection pool bounds
+_POOL_MIN_SIZE = 1
+_POOL_MAX_SIZE = 20
+
+# Items per namespace under a user prefix, skipping expired items
+_COUNT_NAMESPACES_SQL = """
+SELECT prefix, COUNT(*) AS file_count
+FROM store
+WHERE prefix LIKE %s ESCAPE '\\'
+  AND (expires_at IS NULL OR expires_at > NOW())
+GROUP BY prefix
+"""
+
+# Keys in a namespace containing a pattern (case-insensitive), skipping expired items
+_SEARCH_KEYS_SQL = """
+SELECT key, created_at, updated_at
+FROM store
+WHERE prefix = %s
+  AND key ILIKE %s ESCAPE '\\'
+  AND (expires_at IS NULL OR expires_at > NOW())
+"""
+
+
+def _escape_like(text: str) -> str:
+    """Escape LIKE wildcards so text is matched literally."""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
 class PostgreSQLConnection:
+    __slots__ = (
+        "settings", "postgres_url", "ttl_config", "_setup_done", "_lock", "_pool", "_stores",
+    )
+    
     def __init__(self):
         self.settings = settings.postgresql
-        self.postgres_url = self.settings.get_connection_string()
-        os.environ["POSTGRES_URL"] = self.postgres_url
-        logger.debug(f"Initializing PostgreSQL connection to {self.settings.HOST}:{self.settings.PORT}/{self.settings.DATABASE}")
+        self.postgres_url = self.settings.url
+        os.environ.setdefault("POSTGRES_URL", self.postgres_url)
+        logger.debug("Initializing PostgreSQL connection to %s:%s/%s", self.settings.HOST, self.settings.PORT, self.settings.DATABASE)
         
         # Default TTL configuration
         self.ttl_config = None
         self._setup_done = False
+        self._lock = asyncio.Lock()
+        
+        # Long-lived pool shared by every store, opened on first use
+        self._pool = self._create_pool()
+        self._stores: dict[Optional[tuple], AsyncPostgresStore] = {}
         
+    def _create_pool(self) -> AsyncConnectionPool:
+        """Build an unopened pool, connection settings match AsyncPostgresStore.from_conn_string."""
+        return AsyncConnectionPool(
+            conninfo=self.postgres_url,
+            min_size=_POOL_MIN_SIZE,
+            max_size=_POOL_MAX_SIZE,
+            open=False,
+            kwargs={"autocommit": True, "prepare_threshold": 0, "row_factory": dict_row},
+        )
+    
     async def ensure_setup(self):
-        """Ensure the store is set up (run migrations)."""
-        if not self._setup_done:
-            logger.info("Running PostgreSQL store setup (migrations)...")
-            async with AsyncPostgresStore.from_conn_string(self.postgres_url) as store:
-                await store.setup()
-            self._setup_done = True
-            logger.info("PostgreSQL store setup completed")
+        """Ensure the store is set up (open the pool and run migrations)."""
+        if self._setup_done:
+            return
+        async with self._lock:
+            if not self._setup_done:
+                logger.info("Running PostgreSQL store setup (migrations)...")
+                await self._pool.open()
+                await AsyncPostgresStore(self._pool).setup()
+                self._setup_done = True
+                logger.info("PostgreSQL store setup completed")
     
     @asynccontextmanager
     async def get_store(self, ttl_config: dict = None):
@@ -39,8 +93,52 @@ class PostgreSQLConnection:
         ttl = ttl_config or self.ttl_config
         
         logger.debug("Returning PostgreSQL store with TTL config")
-        async with AsyncPostgresStore.from_conn_string(self.postgres_url, ttl=ttl) as store:
-            yield store
+        store = self._stores.get(ttl_key(ttl))
+        if store is None:
+            store = self._stores[ttl_key(ttl)] = AsyncPostgresStore(self._pool, ttl=ttl)
+        
+        # Connections are borrowed from the pool per operation, nothing to close here
+        yield store
+    
+    async def close(self):
+        """
+        Close the connection pool. Meant for process shutdown, the pool is shared by all sessions.
+        A fresh pool replaces it, since a closed pool can't be reopened.
+        """
+        self._stores.clear()
+        self._setup_done = False
+        pool, self._pool = self._pool, self._create_pool()
+        await pool.close()
+    
+    async def count_namespaces(self, user_id: str) -> dict[str, int]:
+        """
+        Count stored items per namespace for a user.
+        Aggregated server-side with GROUP BY instead of fetching every item.
+        """
+        await self.ensure_setup()
+        user_prefix = f"{user_id}."
+        async with self._pool.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(_COUNT_NAMESPACES_SQL, (f"{_escape_like(user_prefix)}%",))
+                rows = await cur.fetchall()
+        
+        return {
+            row["prefix"][len(user_prefix):]: row["file_count"]
+            for row in rows
+        }
+    
+    async def search_keys(self, user_id: str, namespace: str, pattern: str) -> list[dict]:
+        """
+        Find keys in a namespace that contain pattern (case-insensitive).
+        Filtered server-side with ILIKE, only key and timestamps are returned.
+        """
+        await self.ensure_setup()
+        params = (f"{user_id}.{namespace}", f"%{_escape_like(pattern)}%")
+        async with self._pool.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(_SEARCH_KEYS_SQL, params)
+                return await cur.fetchall()
+
 
 
 postgresql_connection = PostgreSQLConnection()
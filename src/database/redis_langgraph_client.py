@@ -1,34 +1,82 @@
 import asyncio
 import os
+from datetime import datetime, timezone
 
 from core.settings import settings
 from core.logger import get_logger
+from database._common import ttl_key
 from langgraph.store.redis.aio import AsyncRedisStore
-from contextlib import asynccontextmanager
+from langgraph.store.redis.token_unescaper import TokenUnescaper
+from redis.commands.search import reducers
+from redis.commands.search.aggregation import AggregateRequest
+from redis.commands.search.query import Query
+from redisvl.utils.token_escaper import TokenEscaper
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Optional
 
 logger = get_logger("redis_connection")
 
+# The store indexes namespaces as escaped text, same escaping as AsyncRedisStore
+_token_escaper = TokenEscaper()
+_token_unescaper = TokenUnescaper()
+
+# Number of documents fetched per FT.SEARCH page
+_SEARCH_PAGE_SIZE = 100
+
+# Wildcard expansion is limited by the index MINPREFIX (default 2), shorter
+# patterns fetch the whole namespace and are matched client-side
+_MIN_WILDCARD_LENGTH = 2
+
+
+def _decode(value):
+    """Decode a Redis reply value that may be returned as bytes."""
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _from_timestamp(value) -> datetime:
+    """Convert a stored microsecond timestamp to a UTC datetime."""
+    return datetime.fromtimestamp(float(value) / 1_000_000, timezone.utc)
+
+
 class RedisConnection:
+    __slots__ = (
+        "settings", "redis_url", "ttl_config", "_setup_done", "_lock", "_stores", "_exit_stack",
+    )
+    
     def __init__(self):
         self.settings = settings.redis
-        self.redis_url = f"redis://:{settings.redis.PASSWORD}@{settings.redis.HOST}:{settings.redis.PORT}/{settings.redis.DB}"
-        os.environ["REDIS_URL"] = self.redis_url
-        logger.debug(f"Initializing Redis connection to {self.settings.HOST}:{self.settings.PORT}")
+        self.redis_url = self.settings.url
+        os.environ.setdefault("REDIS_URL", self.redis_url)
+        logger.debug("Initializing Redis connection to %s:%s", self.settings.HOST, self.settings.PORT)
         
         # Default TTL configuration
         self.ttl_config = None
         self._setup_done = False
+        self._lock = asyncio.Lock()
+        
+        # Long-lived stores per TTL configuration, all closed together in close()
+        self._stores: dict[Optional[tuple], AsyncRedisStore] = {}
+        self._exit_stack = AsyncExitStack()
         
+    async def _create_store(self, ttl_config: Optional[dict]) -> AsyncRedisStore:
+        """Open a store for a TTL configuration and cache it."""
+        # from_conn_string also creates the search indexes
+        store = await self._exit_stack.enter_async_context(
+            AsyncRedisStore.from_conn_string(self.redis_url, ttl=ttl_config)
+        )
+        self._stores[ttl_key(ttl_config)] = store
+        return store
+    
     async def ensure_setup(self):
         """Ensure the store is set up (run any necessary initialization)."""
-        if not self._setup_done:
-            logger.info("Running Redis store setup...")
-            async with AsyncRedisStore.from_conn_string(self.redis_url) as store:
-                # Redis store may have a setup method, call it if available
-                if hasattr(store, 'setup'):
-                    await store.setup()
-            self._setup_done = True
-            logger.info("Redis store setup completed")
+        if self._setup_done:
+            return
+        async with self._lock:
+            if not self._setup_done:
+                logger.info("Running Redis store setup...")
+                await self._create_store(self.ttl_config)
+                self._setup_done = True
+                logger.info("Redis store setup completed")
     
     @asynccontextmanager
     async def get_store(self, ttl_config: dict = None):
@@ -41,8 +89,82 @@ class RedisConnection:
         ttl = ttl_config or self.ttl_config
         
         logger.debug("Returning Async Redis store with TTL config")
-        async with AsyncRedisStore.from_conn_string(self.redis_url, ttl=ttl) as store:
-            yield store
+        store = self._stores.get(ttl_key(ttl))
+        if store is None:
+            async with self._lock:
+                store = self._stores.get(ttl_key(ttl)) or await self._create_store(ttl)
+        
+        # The store is shared, its connection is closed in close() at shutdown
+        yield store
+    
+    async def close(self):
+        """
+        Close the cached stores and their Redis connections. Meant for process shutdown,
+        the stores are shared by all sessions. Stores opened later go on a fresh exit stack.
+        """
+        self._stores.clear()
+        self._setup_done = False
+        exit_stack, self._exit_stack = self._exit_stack, AsyncExitStack()
+        await exit_stack.aclose()
+    
+    async def count_namespaces(self, user_id: str) -> dict[str, int]:
+        """
+        Count stored items per namespace for a user.
+        Aggregated server-side with FT.AGGREGATE instead of fetching every item.
+        """
+        user_prefix = f"{user_id}."
+        request = (
+            AggregateRequest(f"@prefix:{_token_escaper.escape(user_prefix)}*")
+            .load("@prefix")
+            .group_by("@prefix", reducers.count().alias("file_count"))
+        )
+        async with self.get_store() as store:
+            result = await store.store_index.aggregate(request)
+        
+        counts = {}
+        for row in result.rows:
+            fields = dict(zip(map(_decode, row[::2]), map(_decode, row[1::2])))
+            prefix = _token_unescaper.unescape(fields["prefix"])
+            if prefix.startswith(user_prefix):
+                counts[prefix[len(user_prefix):]] = int(fields["file_count"])
+        return counts
+    
+    async def search_keys(self, user_id: str, namespace: str, pattern: str) -> list[dict]:
+        """
+        Find keys in a namespace that contain pattern (case-insensitive).
+        Filtered server-side with a TAG wildcard query, only key and timestamps are returned.
+        """
+        prefix = f"{user_id}.{namespace}"
+        query_text = f"@prefix:{_token_escaper.escape(prefix)}"
+        if len(pattern) >= _MIN_WILDCARD_LENGTH:
+            query_text += f" @key:{{*{_token_escaper.escape(pattern)}*}}"
+        query = Query(query_text).return_fields("prefix", "key", "created_at", "updated_at")
+        pattern_lower = pattern.lower()
+        
+        matches = []
+        offset = 0
+        async with self.get_store() as store:
+            while True:
+                result = await store.store_index.search(query.paging(offset, _SEARCH_PAGE_SIZE))
+                for doc in result.docs:
+                    # Text matching on prefix is token-based, so confirm the exact namespace
+                    if _token_unescaper.unescape(_decode(doc.prefix)) != prefix:
+                        continue
+                    # Also covers patterns too short for the wildcard query
+                    key = _decode(doc.key)
+                    if pattern_lower not in key.lower():
+                        continue
+                    matches.append({
+                        "key": key,
+                        "created_at": _from_timestamp(_decode(doc.created_at)),
+                        "updated_at": _from_timestamp(_decode(doc.updated_at)),
+                    })
+                offset += len(result.docs)
+                if not result.docs or offset >= result.total:
+                    break
+        
+        return matches
+
 
 
 redis_connection = RedisConnection()
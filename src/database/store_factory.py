@@ -1,14 +1,28 @@
 """Store Factory for selecting backend based on configuration."""
 
+import importlib
+from functools import lru_cache
+
 from core.settings import settings
 from core.logger import get_logger
 
 logger = get_logger("store_factory")
 
 
+# Backend name -> client module. The database package imports these lazily too,
+# so only the selected backend's client module is ever imported.
+_BACKENDS = {
+    "redis": "database.redis_langgraph_client",
+    "postgresql": "database.postgresql_langgraph_client",
+    "mongodb": "database.mongodb_langgraph_client",
+}
+
+
+@lru_cache(maxsize=1)
 def get_store_connection():
     """
     Get the appropriate store connection based on the BACKEND setting.
+    The backend doesn't change at runtime, so the selection is cached.
     
     Returns:
         Connection object (RedisConnection, PostgreSQLConnection, or MongoDBConnection)
@@ -18,22 +32,11 @@ def get_store_connection():
     """
     backend = settings.BACKEND.lower()
     
-    logger.info(f"Selecting store backend: {backend}")
-    
-    if backend == "redis":
-        from database.redis_langgraph_client import redis_connection
-        logger.debug("Using Redis store backend")
-        return redis_connection
-    elif backend == "postgresql":
-        from database.postgresql_langgraph_client import postgresql_connection
-        logger.debug("Using PostgreSQL store backend")
-        return postgresql_connection
-    elif backend == "mongodb":
-        from database.mongodb_langgraph_client import mongodb_connection
-        logger.debug("Using MongoDB store backend")
-        return mongodb_connection
-    else:
+    module_name = _BACKENDS.get(backend)
+    if module_name is None:
         error_msg = f"Invalid BACKEND setting: '{backend}'. Must be one of: redis, postgresql, mongodb"
         logger.error(error_msg)
         raise ValueError(error_msg)
-
+    
+    logger.info("Selecting store backend: %s", backend)
+    return getattr(importlib.import_module(module_name), f"{backend}_connection")
@@ -1,5 +1,7 @@
+import asyncio
+
 from fastmcp import FastMCP
-from services.file_store import file_store
+from services.file_store import file_store, store_connection
 from core.logger import get_logger
 from core.settings import settings
 
@@ -34,7 +36,7 @@ async def ls(memory_category: str = "", show_all_available: bool = False) -> dic
             all_namespaces = await file_store.list_namespaces()
             
             # Get allowed files to determine access
-            allowed_files = settings.get_allowed_files()
+            allowed_files = settings.allowed_files
             configured_categories = file_config.get_all_categories()
             
             # Annotate each namespace with access information
@@ -249,14 +251,24 @@ async def edit_file(memory_category: str, file_name: str, content: str) -> dict:
         }
 
 
+async def run_server(transport: str, **transport_kwargs) -> None:
+    """Run the MCP server and close the store connection when the process shuts down."""
+    # FastMCP's lifespan is entered per session with streamable-http, so the shared
+    # connection is closed here, once, after the server has stopped
+    try:
+        await mcp.run_async(transport=transport, **transport_kwargs)
+    finally:
+        await store_connection.close()
+
+
 if __name__ == "__main__":
     transport = settings.TRANSPORT.lower()
     
     if transport == "stdio":
         logger.info("Starting MCP server with stdio transport")
-        mcp.run(transport="stdio")
+        asyncio.run(run_server("stdio"))
     elif transport == "streamable-http":
         logger.info(f"Starting MCP server with streamable-http transport on {settings.HOST}:{settings.PORT}")
-        mcp.run(transport="streamable-http", host=settings.HOST, port=settings.PORT)
+        asyncio.run(run_server("streamable-http", host=settings.HOST, port=settings.PORT))
     else:
         raise ValueError(f"Invalid transport mode: {transport}. Must be 'stdio' or 'streamable-http'")
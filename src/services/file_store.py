@@ -1,7 +1,8 @@
 """File Store Manager for LangGraph Store operations."""
 
 import re
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional, Any
 
 from core.logger import get_logger
@@ -10,6 +11,25 @@ from database.store_factory import get_store_connection
 
 logger = get_logger("file_store")
 
+# Allowed characters for namespaces and keys
+_ID_RE = re.compile(r'\A[A-Za-z0-9_\-]+\Z').match
+
+
+@lru_cache(maxsize=4096)
+def _validate_cached(identifier: str) -> bool:
+    """Check identifier format, memoized since namespaces and keys repeat across calls."""
+    return bool(_ID_RE(identifier))
+
+
+@lru_cache(maxsize=1024)
+def _prefix(user_id: str, namespace: str) -> tuple[str, str]:
+    """Store namespace tuple for a user and namespace, shared across calls."""
+    return (user_id, namespace)
+
+
+# Writes of content at least this long are never compared against the stored value
+_DEDUP_MAX_CONTENT_LENGTH = 4096
+
 # Get the store connection based on BACKEND setting
 store_connection = get_store_connection()
 
@@ -17,41 +37,48 @@ store_connection = get_store_connection()
 class FileStore:
     """Wrapper class for LangGraph store operations with validation and metadata."""
     
+    __slots__ = ("settings", "_user_id")
+    
     def __init__(self):
         self.settings = settings
-        self._validate_pattern = re.compile(r'^[a-zA-Z0-9_-]+$')
-    
-    @property
-    def USER_ID(self) -> str:
-        """Get the user ID from settings."""
-        return self.settings.USER_ID
+        self._user_id = settings.USER_ID
     
     def _is_namespace_allowed(self, namespace: str) -> bool:
         """Check if namespace is in allowed list (empty list = all allowed)."""
-        # For all categories, check allowed list (empty = all allowed)
-        allowed = self.settings.get_allowed_files()
-        if not allowed:
-            return True
-        
-        # This method is for namespace/category checking, so always return True
-        # since file-level filtering is done elsewhere
-        return True
+        allowed = self.settings.allowed_namespaces
+        return not allowed or namespace in allowed
     
     def _is_read_only(self, namespace: str, key: str) -> bool:
         """Check if a file is marked as read-only."""
-        file_path = f"{namespace}/{key}"
-        read_only_files = self.settings.get_read_only_files()
-        return file_path in read_only_files
+        return f"{namespace}/{key}" in self.settings.read_only_files
     
     def _validate_identifier(self, identifier: str, name: str = "identifier") -> None:
         """Validate namespace or key format."""
         if not identifier:
             raise ValueError(f"{name} cannot be empty")
-        if not self._validate_pattern.match(identifier):
+        if not _validate_cached(identifier):
             raise ValueError(
                 f"{name} must contain only alphanumeric characters, hyphens, and underscores. Got: {identifier}"
             )
     
+    def _check(self, namespace: str, key: Optional[str] = None, *, write: bool = False) -> tuple[str, str]:
+        """Validate namespace/key and check access.
+        
+        Returns:
+            The store namespace tuple for the namespace
+        """
+        self._validate_identifier(namespace, "namespace")
+        if key is not None:
+            self._validate_identifier(key, "key")
+        
+        if not self._is_namespace_allowed(namespace):
+            raise PermissionError(f"Namespace '{namespace}' is not in the allowed list")
+        
+        if write and self._is_read_only(namespace, key):
+            raise PermissionError(f"Memory '{namespace}/{key}' is marked as read-only")
+        
+        return _prefix(self._user_id, namespace)
+    
     async def list_namespaces(self) -> list[dict[str, Any]]:
         """List all available namespaces.
         
@@ -60,29 +87,17 @@ class FileStore:
         """
         logger.debug("Listing all namespaces")
         
-        async with store_connection.get_store() as store:
-            # Search for all items to get namespaces
-            items = await store.asearch((self.USER_ID,))
-            
-            # Extract unique namespaces
-            namespaces_data = {}
-            for item in items:
-                namespace = item.namespace[0] if item.namespace else "default"
-                
-                # Check if namespace is allowed
-                if not self._is_namespace_allowed(namespace):
-                    continue
-                
-                if namespace not in namespaces_data:
-                    namespaces_data[namespace] = {
-                        "name": namespace,
-                        "file_count": 0
-                    }
-                namespaces_data[namespace]["file_count"] += 1
-            
-            result = list(namespaces_data.values())
-            logger.info(f"Found {len(result)} namespaces")
-            return result
+        # Counted by the backend, so items don't have to be fetched
+        counts = await store_connection.count_namespaces(self._user_id)
+        
+        result = [
+            {"name": namespace, "file_count": file_count}
+            for namespace, file_count in counts.items()
+            if self._is_namespace_allowed(namespace)
+        ]
+        
+        logger.info("Found %d namespaces", len(result))
+        return result
     
     async def list_memories(self, namespace: str) -> list[dict[str, Any]]:
         """List all memories in a namespace.
@@ -93,28 +108,27 @@ class FileStore:
         Returns:
             List of memory metadata dictionaries
         """
-        self._validate_identifier(namespace, "namespace")
+        prefix = self._check(namespace)
         
-        if not self._is_namespace_allowed(namespace):
-            raise PermissionError(f"Namespace '{namespace}' is not in the allowed list")
-        
-        logger.debug(f"Listing memories in namespace: {namespace}")
+        logger.debug("Listing memories in namespace: %s", namespace)
         
         async with store_connection.get_store() as store:
-            items = await store.asearch((self.USER_ID, namespace))
+            items = await store.asearch(prefix)
             
-            memories = []
-            for item in items:
-                memory_data = {
+            # Inline the read-only check with a local reference to the set
+            read_only_files = self.settings.read_only_files
+            memories = [
+                {
                     "key": item.key,
                     "namespace": namespace,
-                    "is_read_only": self._is_read_only(namespace, item.key),
+                    "is_read_only": f"{namespace}/{item.key}" in read_only_files,
                     "created_at": item.created_at,
                     "updated_at": item.updated_at,
                 }
-                memories.append(memory_data)
+                for item in items
+            ]
             
-            logger.info(f"Found {len(memories)} memories in namespace '{namespace}'")
+            logger.info("Found %d memories in namespace '%s'", len(memories), namespace)
             return memories
     
     async def get_memory(self, namespace: str, key: str) -> dict[str, Any]:
@@ -127,16 +141,12 @@ class FileStore:
         Returns:
             Memory data with content and metadata
         """
-        self._validate_identifier(namespace, "namespace")
-        self._validate_identifier(key, "key")
-        
-        if not self._is_namespace_allowed(namespace):
-            raise PermissionError(f"Namespace '{namespace}' is not in the allowed list")
+        prefix = self._check(namespace, key)
         
-        logger.debug(f"Reading memory: {namespace}/{key}")
+        logger.debug("Reading memory: %s/%s", namespace, key)
         
         async with store_connection.get_store() as store:
-            item = await store.aget((self.USER_ID, namespace), key)
+            item = await store.aget(prefix, key)
             
             if item is None:
                 raise FileNotFoundError(f"Memory '{key}' not found in namespace '{namespace}'")
@@ -150,7 +160,7 @@ class FileStore:
                 "updated_at": item.updated_at,
             }
             
-            logger.info(f"Successfully read memory: {namespace}/{key}")
+            logger.info("Successfully read memory: %s/%s", namespace, key)
             return result
     
     async def put_memory(self, namespace: str, key: str, content: str) -> dict[str, Any]:
@@ -164,38 +174,49 @@ class FileStore:
         Returns:
             Success status and metadata
         """
-        self._validate_identifier(namespace, "namespace")
-        self._validate_identifier(key, "key")
+        prefix = self._check(namespace, key, write=True)
         
-        if not self._is_namespace_allowed(namespace):
-            raise PermissionError(f"Namespace '{namespace}' is not in the allowed list")
-        
-        if self._is_read_only(namespace, key):
-            raise PermissionError(f"Memory '{namespace}/{key}' is marked as read-only")
-        
-        logger.debug(f"Writing memory: {namespace}/{key}")
+        logger.debug("Writing memory: %s/%s", namespace, key)
         
         async with store_connection.get_store() as store:
+            # Skip rewriting small memories whose content is unchanged (e.g. retried tool calls)
+            if self.settings.FILE_STORE_DEDUP_WRITES and len(content) < _DEDUP_MAX_CONTENT_LENGTH:
+                existing = await store.aget(prefix, key)
+                if (
+                    existing is not None
+                    and isinstance(existing.value, dict)
+                    and existing.value.get("content") == content
+                ):
+                    logger.info("Memory unchanged, skipped write: %s/%s", namespace, key)
+                    return {
+                        "namespace": namespace,
+                        "key": key,
+                        "success": True,
+                        "unchanged": True,
+                        "message": "Memory content unchanged",
+                        "created_at": existing.created_at,
+                        "updated_at": existing.updated_at,
+                    }
+            
             # Store with metadata
             value = {
                 "content": content,
             }
             
-            await store.aput((self.USER_ID, namespace), key, value)
-            
-            # Retrieve to get timestamps
-            item = await store.aget((self.USER_ID, namespace), key)
+            # Timestamps are taken client-side to avoid reading the item back
+            now = datetime.now(timezone.utc)
+            await store.aput(prefix, key, value)
             
             result = {
                 "namespace": namespace,
                 "key": key,
                 "success": True,
                 "message": "Memory created/updated successfully",
-                "created_at": item.created_at if item else None,
-                "updated_at": item.updated_at if item else None,
+                "created_at": now,
+                "updated_at": now,
             }
             
-            logger.info(f"Successfully wrote memory: {namespace}/{key}")
+            logger.info("Successfully wrote memory: %s/%s", namespace, key)
             return result
     
     async def update_memory(self, namespace: str, key: str, content: str) -> dict[str, Any]:
@@ -209,20 +230,13 @@ class FileStore:
         Returns:
             Success status and metadata
         """
-        self._validate_identifier(namespace, "namespace")
-        self._validate_identifier(key, "key")
-        
-        if not self._is_namespace_allowed(namespace):
-            raise PermissionError(f"Namespace '{namespace}' is not in the allowed list")
-        
-        if self._is_read_only(namespace, key):
-            raise PermissionError(f"Memory '{namespace}/{key}' is marked as read-only")
+        prefix = self._check(namespace, key, write=True)
         
-        logger.debug(f"Updating memory: {namespace}/{key}")
+        logger.debug("Updating memory: %s/%s", namespace, key)
         
         async with store_connection.get_store() as store:
             # Check if exists
-            existing = await store.aget((self.USER_ID, namespace), key)
+            existing = await store.aget(prefix, key)
             if existing is None:
                 raise FileNotFoundError(f"Memory '{key}' not found in namespace '{namespace}'. Use write_file to create new memories.")
             
@@ -231,21 +245,20 @@ class FileStore:
                 "content": content,
             }
             
-            await store.aput((self.USER_ID, namespace), key, value)
-            
-            # Retrieve to get timestamps
-            item = await store.aget((self.USER_ID, namespace), key)
+            # Keep created_at from the existence check, take updated_at client-side
+            now = datetime.now(timezone.utc)
+            await store.aput(prefix, key, value)
             
             result = {
                 "namespace": namespace,
                 "key": key,
                 "success": True,
                 "message": "Memory updated successfully",
-                "created_at": item.created_at if item else None,
-                "updated_at": item.updated_at if item else None,
+                "created_at": existing.created_at,
+                "updated_at": now,
             }
             
-            logger.info(f"Successfully updated memory: {namespace}/{key}")
+            logger.info("Successfully updated memory: %s/%s", namespace, key)
             return result
     
     async def search_memories(self, namespace: str, pattern: str) -> list[dict[str, Any]]:
@@ -258,19 +271,29 @@ class FileStore:
         Returns:
             List of matching memories
         """
-        self._validate_identifier(namespace, "namespace")
+        self._check(namespace)
         
-        if not self._is_namespace_allowed(namespace):
-            raise PermissionError(f"Namespace '{namespace}' is not in the allowed list")
+        logger.debug("Searching memories in %s with pattern: %s", namespace, pattern)
         
-        logger.debug(f"Searching memories in {namespace} with pattern: {pattern}")
+        # An empty pattern matches every key
+        if not pattern:
+            return await self.list_memories(namespace)
         
-        memories = await self.list_memories(namespace)
+        # Matching is done by the backend, only matching keys are fetched
+        matches = await store_connection.search_keys(self._user_id, namespace, pattern)
         
-        # Simple pattern matching (can be enhanced)
-        matching = [m for m in memories if pattern.lower() in m["key"].lower()]
+        matching = [
+            {
+                "key": match["key"],
+                "namespace": namespace,
+                "is_read_only": self._is_read_only(namespace, match["key"]),
+                "created_at": match["created_at"],
+                "updated_at": match["updated_at"],
+            }
+            for match in matches
+        ]
         
-        logger.info(f"Found {len(matching)} matching memories")
+        logger.info("Found %d matching memories", len(matching))
         return matching
 
 